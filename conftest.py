@@ -0,0 +1,203 @@
+"""
+Shared fixtures for the Cannacraft Selenium test suite
+"""
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+import os
+import socket
+import threading
+import time
+
+
+def find_index_file():
+    """Locate the website's HTML file, returning its absolute path or None"""
+    possible_paths = [
+        Path("index.html"),
+        Path("website.html"),
+        Path("../index.html"),
+        Path(__file__).parent / "index.html",
+    ]
+
+    found = next((path for path in possible_paths if path.exists()), None)
+    return found.resolve() if found else None
+
+
+def is_port_open(host, port, timeout=1):
+    """Check if a port is open"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    result = sock.connect_ex((host, port))
+    sock.close()
+    return result == 0
+
+
+# Resolved once at import rather than on every fixture setup. A server on
+# localhost answers well within 100ms, so a longer probe only delays runs
+# where nothing is listening.
+INDEX_FILE = find_index_file()
+HAS_HTTP_SERVER = is_port_open('localhost', 8080, timeout=0.1)
+
+
+def wait_for_port(host, port, timeout=30):
+    """Poll until a port accepts connections, like Selenium's SocketPoller"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return True
+        except OSError:
+            time.sleep(0.25)
+    return False
+
+
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that keeps request logs out of the test output"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="session")
+def app_url():
+    """Resolve the URL of the website under test"""
+    # Check if HTTP server is running (CI environment)
+    if HAS_HTTP_SERVER:
+        url = "http://localhost:8080/index.html"
+        print(f"\n✅ Using HTTP server: {url}")
+        yield url
+        return
+
+    # Fallback to an in-process HTTP server for local testing
+    file_path = INDEX_FILE
+    if not file_path:
+        pytest.skip("index.html not found. Please ensure the HTML file is in the repository root.")
+
+    handler = partial(QuietHTTPRequestHandler, directory=str(file_path.parent))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_port}/{file_path.name}"
+    print(f"\n✅ Using local HTTP server: {url}")
+    try:
+        yield url
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def load_page(driver, url):
+    """Load the website and wait for it to render"""
+    driver.get(url)
+
+    # Wait for page to load
+    try:
+        WebDriverWait(driver, 10, poll_frequency=0.05).until(
+            EC.presence_of_element_located((By.CLASS_NAME, "logo"))
+        )
+        print(f"✅ Page loaded successfully from: {url}")
+    except TimeoutException:
+        print("❌ Page failed to load within timeout")
+        pytest.fail("Page did not load properly")
+
+
+@pytest.fixture(scope="session")
+def driver(app_url):
+    """Setup Chrome driver with options, shared by the whole session
+
+    Under pytest-xdist every worker is its own session, so each worker
+    gets exactly one Chrome.
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+
+    # Skip browser subsystems the tests never touch to cut startup time
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--mute-audio")
+    chrome_options.add_argument("--no-first-run")
+    chrome_options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+
+    # The page script is inline at the end of <body>, so it has run by
+    # DOMContentLoaded; there is no need to wait for the full load event
+    chrome_options.page_load_strategy = "eager"
+
+    # No implicit wait: every lookup runs after an explicit wait for the
+    # page state, so a miss should fail fast instead of retrying for 10s
+    selenium_url = os.environ.get("SELENIUM_URL")
+    if selenium_url:
+        # Reuse an already running Selenium server (e.g. selenium/standalone-chrome)
+        server = urlparse(selenium_url)
+        if not wait_for_port(server.hostname, server.port or 4444):
+            pytest.fail(f"Selenium server not reachable at {selenium_url}")
+        driver = webdriver.Remote(command_executor=selenium_url, options=chrome_options)
+        print(f"\n✅ Using remote Selenium server: {selenium_url}")
+    else:
+        # Opt-in: keep the profile and disk cache under CHROME_PROFILE_DIR
+        # between runs. Chrome locks its profile, so every xdist worker gets
+        # a directory of its own, and concurrent runs need different roots.
+        profile_root = os.environ.get("CHROME_PROFILE_DIR")
+        if profile_root:
+            worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+            profile_dir = os.path.join(profile_root, worker)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+        driver = webdriver.Chrome(options=chrome_options)
+
+    try:
+        load_page(driver, app_url)
+        yield driver
+    finally:
+        driver.quit()
+
+
+@pytest.fixture(scope="session")
+def element_cache():
+    """Located elements keyed by (by, value), kept until the page reloads"""
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def reset(request, driver, app_url, element_cache):
+    """Reload the page for tests marked with @pytest.mark.fresh"""
+    # This is a real navigation on purpose. Injecting the markup with CDP
+    # Page.setDocumentContent keeps the same window, so the page script's
+    # top-level consts are redeclared (a SyntaxError) and timers scheduled
+    # by earlier submissions keep running.
+    if request.node.get_closest_marker("fresh"):
+        load_page(driver, app_url)
+        element_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_ui(driver):
+    """Clear forms and banners and return Home after each test, without a reload"""
+    yield
+    driver.execute_script("""
+        document.querySelectorAll('form').forEach(f => f.reset());
+        document.querySelectorAll('.success-message').forEach(m => m.classList.remove('show'));
+        document.querySelectorAll('.star.active').forEach(s => s.classList.remove('active'));
+        document.getElementById('ratingValue').value = '';
+        document.getElementById('nav-home').click();
+    """)
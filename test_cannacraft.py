@@ -4,101 +4,152 @@ Run: pytest test_cannacraft.py -v --html=report.html
 """
 
 import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
-import os
-import sys
-import socket
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+
+# Nav button locators, built once and shared by every test
+NAV = {
+    "home": (By.ID, "nav-home"),
+    "address": (By.ID, "nav-address"),
+    "appointment": (By.ID, "nav-appointment"),
+    "feedback": (By.ID, "nav-feedback"),
+}
 
 
 class TestCannacraftWebsite:
     
-    @pytest.fixture(scope="class")
-    def driver(self):
-        """Setup Chrome driver with options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.implicitly_wait(10)
-        
-        # Check if HTTP server is running (CI environment)
-        if self.is_port_open('localhost', 8080):
-            url = "http://localhost:8080/index.html"
-            print(f"\n✅ Using HTTP server: {url}")
-        else:
-            # Fallback to file:// protocol for local testing
-            possible_paths = [
-                "index.html",
-                "website.html",
-                "../index.html",
-                os.path.join(os.path.dirname(__file__), "index.html")
-            ]
-            
-            file_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    file_path = os.path.abspath(path)
-                    break
-            
-            if not file_path:
-                pytest.skip("index.html not found. Please ensure the HTML file is in the repository root.")
-            
-            url = f"file://{file_path}"
-            print(f"\n✅ Using local file: {url}")
-        
-        driver.get(url)
-        
-        # Wait for page to load
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "logo"))
-            )
-            print(f"✅ Page loaded successfully from: {url}")
-        except TimeoutException:
-            print("❌ Page failed to load within timeout")
-            driver.quit()
-            pytest.fail("Page did not load properly")
-        
-        yield driver
-        driver.quit()
+    @pytest.fixture(autouse=True)
+    def use_element_cache(self, element_cache):
+        """Expose the session's element cache to the helper methods"""
+        self.element_cache = element_cache
+    
+    @pytest.fixture
+    def address_form(self, driver):
+        """Show the Add Address page and return its form element"""
+        return self.goto(driver, "address")
     
-    def is_port_open(self, host, port):
-        """Check if a port is open"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex((host, port))
-        sock.close()
-        return result == 0
+    @pytest.fixture
+    def feedback_form(self, driver):
+        """Show the Feedback page and return its form element"""
+        return self.goto(driver, "feedback")
+    
+    def goto(self, driver, page_id):
+        """Show a page through the site's own showPage() and return its form, if any"""
+        return driver.execute_script(
+            "showPage(arguments[0]); return document.getElementById(arguments[0] + 'Form');",
+            page_id,
+        )
     
     def wait_for_element(self, driver, by, value, timeout=10):
         """Helper method to wait for element"""
         try:
-            return WebDriverWait(driver, timeout).until(
+            return self.fast_wait(driver, timeout).until(
                 EC.presence_of_element_located((by, value))
             )
         except TimeoutException:
             pytest.fail(f"Element not found: {by}={value}")
     
     def wait_for_clickable(self, driver, by, value, timeout=10):
-        """Helper method to wait for clickable element"""
+        """Helper method to wait for clickable element, reusing cached lookups
+        
+        The cache is shared by the whole session rather than one test: SPA
+        navigation only toggles classes, so handles stay valid until a fresh
+        test reloads the page and clears it. A cached element is reused only
+        while it is still displayed and enabled.
+        """
+        cached = self.element_cache.get((by, value))
+        if cached is not None:
+            try:
+                if cached.is_displayed() and cached.is_enabled():
+                    return cached
+            except StaleElementReferenceException:
+                pass
+        
         try:
-            return WebDriverWait(driver, timeout).until(
+            element = self.fast_wait(driver, timeout).until(
                 EC.element_to_be_clickable((by, value))
             )
         except TimeoutException:
             pytest.fail(f"Element not clickable: {by}={value}")
+        self.element_cache[(by, value)] = element
+        return element
+    
+    def fast_wait(self, driver, timeout=3, poll=0.05):
+        """Wait that polls every 50ms, for UI state that flips almost instantly"""
+        return WebDriverWait(
+            driver,
+            timeout,
+            poll_frequency=poll,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException),
+        )
+    
+    def wait_for_attribute(self, driver, element_id, attribute, text, timeout=5):
+        """Helper method to wait for text in an element attribute"""
+        try:
+            return self.fast_wait(driver, timeout).until(
+                EC.text_to_be_present_in_element_attribute((By.ID, element_id), attribute, text)
+            )
+        except TimeoutException:
+            pytest.fail(f"Attribute {attribute} of #{element_id} never contained {text!r}")
+    
+    def wait_for_all(self, driver, *conditions, timeout=5):
+        """Helper method to wait for several conditions in a single polling loop"""
+        try:
+            return self.fast_wait(driver, timeout).until(EC.all_of(*conditions))
+        except TimeoutException:
+            pytest.fail(f"Conditions not met within {timeout}s")
+    
+    def wait_for_class(self, driver, element_id, class_name, timeout=5):
+        """Helper method to wait for element to gain a CSS class"""
+        return self.wait_for_attribute(driver, element_id, "class", class_name, timeout)
+    
+    def get_field_names(self, driver, form_id):
+        """Return the names of all named fields in a form in one round trip"""
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll('#' + arguments[0] + ' [name]'))"
+            ".map(e => e.name);",
+            form_id,
+        )
+    
+    def fill_form(self, driver, form_id, data):
+        """Fill several form fields in one round trip, firing input/change events"""
+        driver.execute_script(
+            """
+            const form = document.getElementById(arguments[0]);
+            for (const [name, value] of Object.entries(arguments[1])) {
+                const field = form.elements[name];
+                field.value = value;
+                field.dispatchEvent(new Event('input', {bubbles: true}));
+                field.dispatchEvent(new Event('change', {bubbles: true}));
+            }
+            """,
+            form_id,
+            data,
+        )
+    
+    def get_texts(self, driver, css):
+        """Return the text of every element matching a CSS selector in one round trip"""
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map(e => e.textContent.trim());",
+            css,
+        )
+    
+    def get_attrs(self, driver, css, attr):
+        """Return an attribute of every element matching a CSS selector in one round trip"""
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map(e => e.getAttribute(arguments[1]));",
+            css,
+            attr,
+        )
     
     def test_page_load(self, driver):
         """Test if the page loads correctly"""
@@ -109,10 +160,9 @@ class TestCannacraftWebsite:
     
     def test_navigation_buttons_present(self, driver):
         """Test if all navigation buttons are present"""
-        nav_buttons = driver.find_elements(By.CSS_SELECTOR, ".nav-links button")
-        assert len(nav_buttons) == 4, f"Expected 4 buttons, found {len(nav_buttons)}"
+        button_texts = self.get_texts(driver, ".nav-links button")
+        assert len(button_texts) == 4, f"Expected 4 buttons, found {len(button_texts)}"
         
-        button_texts = [btn.text for btn in nav_buttons]
         assert "Home" in button_texts
         assert "Add Address" in button_texts
         assert "Book Appointment" in button_texts
@@ -130,270 +180,182 @@ class TestCannacraftWebsite:
     
     def test_navigate_to_address_page(self, driver):
         """Test navigation to Add Address page"""
-        address_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Add Address']")
+        address_btn = self.wait_for_clickable(driver, *NAV["address"])
         address_btn.click()
-        time.sleep(1)
-        
-        address_page = driver.find_element(By.ID, "address")
-        assert "active" in address_page.get_attribute("class")
-        
-        form_title = driver.find_element(By.CSS_SELECTOR, "#address h2")
-        assert form_title.text == "Add Address"
+        self.wait_for_all(
+            driver,
+            EC.text_to_be_present_in_element_attribute((By.ID, "address"), "class", "active"),
+            lambda d: d.find_element(By.CSS_SELECTOR, "#address h2").text == "Add Address",
+        )
         print("✅ Navigated to Address page")
     
-    def test_address_form_fields_present(self, driver):
-        """Test all address form fields are present"""
-        # Navigate to address page first
-        address_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Add Address']")
-        address_btn.click()
-        time.sleep(0.5)
-        
-        form = driver.find_element(By.ID, "addressForm")
-        
-        # Check required fields
-        fields = ["firstName", "lastName", "phone", "address", "pinCode", "city", "state", "country"]
-        for field in fields:
-            assert form.find_element(By.NAME, field), f"Field {field} not found"
-        
-        print("✅ All address form fields present")
+    @pytest.mark.parametrize("page_id,fields", [
+        ("address", ["firstName", "lastName", "phone", "address", "pinCode", "city", "state", "country"]),
+        ("appointment", ["firstName", "lastName", "phone", "email", "dob", "appointmentDate", "symptoms"]),
+        ("feedback", ["name", "email", "rating", "feedback"]),
+    ], ids=["address", "appointment", "feedback"])
+    def test_form_fields_present(self, driver, page_id, fields):
+        """Test all form fields are present"""
+        # Show the form page first
+        self.goto(driver, page_id)
+        
+        field_names = self.get_field_names(driver, f"{page_id}Form")
+        missing = set(fields) - set(field_names)
+        assert not missing, f"Fields not found: {sorted(missing)}"
+        print(f"✅ All {page_id} form fields present")
     
-    def test_address_form_submission(self, driver):
-        """Test address form submission with valid data"""
-        # Navigate to address page
-        address_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Add Address']")
-        address_btn.click()
-        time.sleep(0.5)
+    @pytest.mark.parametrize("page_id,data,message", [
+        ("address", {
+            "firstName": "John",
+            "lastName": "Doe",
+            "phone": "1234567890",
+            "address": "123 Main Street",
+            "pinCode": "12345",
+            "city": "New York",
+            "state": "NY",
+            "country": "USA",
+        }, "successfully"),
+        # Date inputs take ISO values when assigned directly
+        ("appointment", {
+            "firstName": "Jane",
+            "lastName": "Smith",
+            "phone": "9876543210",
+            "email": "jane@example.com",
+            "dob": "1990-01-01",
+            "appointmentDate": "2025-12-31",
+            "symptoms": "Regular checkup",
+        }, "successfully"),
+        # The rating is normally set by the star widget, covered separately
+        ("feedback", {
+            "name": "Alex Johnson",
+            "email": "alex@example.com",
+            "rating": "5",
+            "feedback": "Excellent service!",
+        }, "Thank you"),
+    ], ids=["address", "appointment", "feedback"])
+    def test_form_submission(self, driver, page_id, data, message):
+        """Test form submission with valid data"""
+        # Show the form page
+        self.goto(driver, page_id)
         
         # Fill form
-        driver.find_element(By.NAME, "firstName").send_keys("John")
-        driver.find_element(By.NAME, "lastName").send_keys("Doe")
-        driver.find_element(By.NAME, "phone").send_keys("1234567890")
-        driver.find_element(By.NAME, "address").send_keys("123 Main Street")
-        driver.find_element(By.NAME, "pinCode").send_keys("12345")
-        driver.find_element(By.NAME, "city").send_keys("New York")
-        driver.find_element(By.NAME, "state").send_keys("NY")
-        driver.find_element(By.NAME, "country").send_keys("USA")
+        self.fill_form(driver, f"{page_id}Form", data)
         
         # Submit form
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "#addressForm .btn-save")
+        submit_btn = driver.find_element(By.ID, f"{page_id}-save")
         submit_btn.click()
         
-        # Check success message
-        time.sleep(1)
-        success_msg = driver.find_element(By.ID, "addressSuccess")
-        assert "show" in success_msg.get_attribute("class")
-        assert "successfully" in success_msg.text.lower()
-        print("✅ Address form submission successful")
+        # Check success message, reading its class and text in one call
+        self.wait_for_class(driver, f"{page_id}Success", "show")
+        class_name, text = driver.execute_script(
+            "const m = document.getElementById(arguments[0]); return [m.className, m.textContent];",
+            f"{page_id}Success",
+        )
+        assert "show" in class_name
+        assert message in text
+        print(f"✅ {page_id.capitalize()} form submission successful")
     
-    def test_address_form_validation(self, driver):
+    def test_address_form_validation(self, driver, address_form):
         """Test address form validation for required fields"""
-        # Navigate to address page
-        address_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Add Address']")
-        address_btn.click()
-        time.sleep(0.5)
-        
-        # Try to submit empty form
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "#addressForm .btn-save")
-        submit_btn.click()
-        
-        # Check if required field validation works
-        first_name = driver.find_element(By.NAME, "firstName")
-        validation_message = first_name.get_attribute("validationMessage")
+        # Check required field validation on an empty form without submitting it
+        validation_message = driver.execute_script(
+            "arguments[0].checkValidity();"
+            " return arguments[0].elements['firstName'].validationMessage;",
+            address_form,
+        )
         assert validation_message != "", "Validation message should not be empty"
         print("✅ Form validation working")
     
     def test_navigate_to_appointment_page(self, driver):
         """Test navigation to Book Appointment page"""
-        appointment_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Book Appointment']")
+        appointment_btn = self.wait_for_clickable(driver, *NAV["appointment"])
         appointment_btn.click()
-        time.sleep(1)
-        
-        appointment_page = driver.find_element(By.ID, "appointment")
-        assert "active" in appointment_page.get_attribute("class")
-        
-        form_title = driver.find_element(By.CSS_SELECTOR, "#appointment h2")
-        assert "Schedule Your Appointment" in form_title.text
+        self.wait_for_all(
+            driver,
+            EC.text_to_be_present_in_element_attribute((By.ID, "appointment"), "class", "active"),
+            EC.text_to_be_present_in_element((By.CSS_SELECTOR, "#appointment h2"), "Schedule Your Appointment"),
+        )
         print("✅ Navigated to Appointment page")
     
-    def test_appointment_form_fields_present(self, driver):
-        """Test all appointment form fields are present"""
-        # Navigate to appointment page
-        appointment_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Book Appointment']")
-        appointment_btn.click()
-        time.sleep(0.5)
-        
-        form = driver.find_element(By.ID, "appointmentForm")
-        
-        fields = ["firstName", "lastName", "phone", "email", "dob", "appointmentDate", "symptoms"]
-        for field in fields:
-            assert form.find_element(By.NAME, field), f"Field {field} not found"
-        
-        print("✅ All appointment form fields present")
-    
-    def test_appointment_form_submission(self, driver):
-        """Test appointment form submission with valid data"""
-        # Navigate to appointment page
-        appointment_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Book Appointment']")
-        appointment_btn.click()
-        time.sleep(0.5)
-        
-        # Fill form
-        driver.find_element(By.NAME, "firstName").send_keys("Jane")
-        driver.find_element(By.NAME, "lastName").send_keys("Smith")
-        driver.find_element(By.NAME, "phone").send_keys("9876543210")
-        driver.find_element(By.NAME, "email").send_keys("jane@example.com")
-        driver.find_element(By.NAME, "dob").send_keys("01011990")
-        driver.find_element(By.NAME, "appointmentDate").send_keys("12312025")
-        driver.find_element(By.NAME, "symptoms").send_keys("Regular checkup")
-        
-        # Submit form
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "#appointmentForm .btn-save")
-        submit_btn.click()
-        
-        # Check success message
-        time.sleep(1)
-        success_msg = driver.find_element(By.ID, "appointmentSuccess")
-        assert "show" in success_msg.get_attribute("class")
-        print("✅ Appointment form submission successful")
-    
     def test_navigate_to_feedback_page(self, driver):
         """Test navigation to Feedback page"""
-        feedback_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Feedback']")
+        feedback_btn = self.wait_for_clickable(driver, *NAV["feedback"])
         feedback_btn.click()
-        time.sleep(1)
-        
-        feedback_page = driver.find_element(By.ID, "feedback")
-        assert "active" in feedback_page.get_attribute("class")
-        
-        form_title = driver.find_element(By.CSS_SELECTOR, "#feedback h2")
-        assert form_title.text == "Customer Feedback"
+        self.wait_for_all(
+            driver,
+            EC.text_to_be_present_in_element_attribute((By.ID, "feedback"), "class", "active"),
+            lambda d: d.find_element(By.CSS_SELECTOR, "#feedback h2").text == "Customer Feedback",
+        )
         print("✅ Navigated to Feedback page")
     
-    def test_feedback_form_fields_present(self, driver):
-        """Test all feedback form fields are present"""
-        # Navigate to feedback page
-        feedback_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Feedback']")
-        feedback_btn.click()
-        time.sleep(0.5)
-        
-        form = driver.find_element(By.ID, "feedbackForm")
-        
-        fields = ["name", "email", "rating", "feedback"]
-        for field in fields:
-            assert form.find_element(By.NAME, field), f"Field {field} not found"
-        
-        print("✅ All feedback form fields present")
-    
-    def test_star_rating_system(self, driver):
+    # A submission elsewhere in the session may still have a delayed
+    # resetForm() pending, which would clear the stars mid-test
+    @pytest.mark.fresh
+    def test_star_rating_system(self, driver, feedback_form):
         """Test star rating interaction"""
-        # Navigate to feedback page
-        feedback_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Feedback']")
-        feedback_btn.click()
-        time.sleep(0.5)
-        
         # Click on 4th star
-        stars = driver.find_elements(By.CLASS_NAME, "star")
+        stars = feedback_form.find_elements(By.CLASS_NAME, "star")
         assert len(stars) == 5, f"Expected 5 stars, found {len(stars)}"
         
         # Use JavaScript click for more reliability
         driver.execute_script("arguments[0].click();", stars[3])
-        time.sleep(0.5)
         
-        # Check if rating value is set
-        rating_value = driver.find_element(By.ID, "ratingValue")
-        assert rating_value.get_attribute("value") == "4"
-        
-        # Check if stars are activated
-        active_stars = driver.find_elements(By.CSS_SELECTOR, ".star.active")
-        assert len(active_stars) == 4
+        # Check the rating value is set and the first four stars are activated
+        self.wait_for_all(
+            driver,
+            EC.text_to_be_present_in_element_attribute((By.ID, "ratingValue"), "value", "4"),
+            lambda d: len(d.find_elements(By.CSS_SELECTOR, ".star.active")) == 4,
+        )
         print("✅ Star rating system working")
     
-    def test_feedback_form_submission(self, driver):
-        """Test feedback form submission with valid data"""
-        # Navigate to feedback page
-        feedback_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Feedback']")
-        feedback_btn.click()
-        time.sleep(0.5)
-        
-        # Fill form
-        driver.find_element(By.NAME, "name").send_keys("Alex Johnson")
-        driver.find_element(By.NAME, "email").send_keys("alex@example.com")
-        
-        # Select rating using JavaScript
-        stars = driver.find_elements(By.CLASS_NAME, "star")
-        driver.execute_script("arguments[0].click();", stars[4])
-        time.sleep(0.5)
-        
-        driver.find_element(By.NAME, "feedback").send_keys("Excellent service!")
-        
-        # Submit form
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "#feedbackForm .btn-save")
-        submit_btn.click()
-        
-        # Check success message
-        time.sleep(1)
-        success_msg = driver.find_element(By.ID, "feedbackSuccess")
-        assert "show" in success_msg.get_attribute("class")
-        assert "Thank you" in success_msg.text
-        print("✅ Feedback form submission successful")
-    
-    def test_feedback_form_validation(self, driver):
+    def test_feedback_form_validation(self, driver, feedback_form):
         """Test feedback form requires rating"""
-        # Navigate to feedback page
-        feedback_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Feedback']")
-        feedback_btn.click()
-        time.sleep(0.5)
-        
         # Fill only name, email, and feedback (no rating)
-        driver.find_element(By.NAME, "name").send_keys("Test User")
-        driver.find_element(By.NAME, "email").send_keys("test@example.com")
-        driver.find_element(By.NAME, "feedback").send_keys("Test feedback")
-        
-        # Try to submit without rating
-        submit_btn = driver.find_element(By.CSS_SELECTOR, "#feedbackForm .btn-save")
-        submit_btn.click()
-        
-        # Check if rating field validation works
-        rating_field = driver.find_element(By.ID, "ratingValue")
-        validation_message = rating_field.get_attribute("validationMessage")
+        # Scope lookups to the form: the appointment form also has an email field
+        feedback_form.find_element(By.NAME, "name").send_keys("Test User")
+        feedback_form.find_element(By.NAME, "email").send_keys("test@example.com")
+        self.fill_form(driver, "feedbackForm", {"feedback": "Test feedback"})
+        
+        # Check if rating field validation works without submitting
+        validation_message = driver.execute_script(
+            "arguments[0].checkValidity();"
+            " return arguments[0].elements['rating'].validationMessage;",
+            feedback_form,
+        )
         assert validation_message != "", "Rating validation should trigger"
         print("✅ Feedback form validation working")
     
-    def test_form_cancel_button(self, driver):
+    def test_form_cancel_button(self, address_form):
         """Test cancel button resets form"""
-        # Navigate to address page
-        address_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Add Address']")
-        address_btn.click()
-        time.sleep(0.5)
-        
         # Fill some fields
-        driver.find_element(By.NAME, "firstName").send_keys("Test")
-        driver.find_element(By.NAME, "phone").send_keys("1234567890")
+        first_name = address_form.find_element(By.NAME, "firstName")
+        first_name.send_keys("Test")
+        address_form.find_element(By.NAME, "phone").send_keys("1234567890")
         
         # Click cancel
-        cancel_btn = driver.find_element(By.CSS_SELECTOR, "#addressForm .btn-cancel")
+        cancel_btn = address_form.find_element(By.ID, "address-cancel")
         cancel_btn.click()
-        time.sleep(0.5)
         
         # Check if form is reset
-        first_name = driver.find_element(By.NAME, "firstName")
         assert first_name.get_attribute("value") == ""
         print("✅ Cancel button working")
     
     def test_hero_button_navigation(self, driver):
         """Test hero button navigates to appointment page"""
-        # Navigate to home page first
-        home_btn = self.wait_for_clickable(driver, By.XPATH, "//button[text()='Home']")
-        home_btn.click()
-        time.sleep(0.5)
+        # Show home page first
+        self.goto(driver, "home")
         
         # Click hero button
         hero_btn = self.wait_for_clickable(driver, By.CLASS_NAME, "hero-btn")
         hero_btn.click()
-        time.sleep(1)
         
-        appointment_page = driver.find_element(By.ID, "appointment")
-        assert "active" in appointment_page.get_attribute("class")
+        # The appointment page shows and only its nav button is highlighted
+        self.wait_for_all(
+            driver,
+            EC.text_to_be_present_in_element_attribute((By.ID, "appointment"), "class", "active"),
+            lambda d: self.get_attrs(d, ".nav-links button.active", "id") == ["nav-appointment"],
+        )
+        assert "active" not in hero_btn.get_attribute("class")
         print("✅ Hero button navigation working")
     
     def test_responsive_elements(self, driver):
@@ -405,26 +367,17 @@ class TestCannacraftWebsite:
         assert container.is_displayed()
         print("✅ Responsive elements present")
     
-    def test_all_pages_accessibility(self, driver):
-        """Test all pages can be accessed and displayed"""
-        pages = {
-            "home": "Home",
-            "address": "Add Address",
-            "appointment": "Book Appointment",
-            "feedback": "Feedback"
-        }
-        
-        for page_id, btn_text in pages.items():
-            # Navigate to page
-            button = self.wait_for_clickable(driver, By.XPATH, f"//button[text()='{btn_text}']")
-            button.click()
-            time.sleep(0.5)
-            
-            # Verify page is active
-            page = driver.find_element(By.ID, page_id)
-            assert "active" in page.get_attribute("class"), f"{page_id} page should be active"
-        
-        print("✅ All pages accessible")
+    @pytest.mark.parametrize("page_id", ["home", "address", "appointment", "feedback"])
+    def test_all_pages_accessibility(self, driver, page_id):
+        """Test every page can be accessed and displayed"""
+        button = self.wait_for_clickable(driver, *NAV[page_id])
+        button.click()
+        self.wait_for_class(driver, page_id, "active")
+        
+        # Verify this page, and only this page, is active
+        active_pages = self.get_attrs(driver, ".page.active", "id")
+        assert active_pages == [page_id], f"{page_id} page should be the only active page"
+        print(f"✅ {page_id} page accessible")
 
 
 if __name__ == "__main__":